@@ -12,14 +12,18 @@ use serde::{Deserialize, Serialize};
 use serde_json::json;
 use std::net::SocketAddr;
 use std::sync::Arc;
+use std::time::Duration;
 use tokio::net::TcpListener;
-use tokio::sync::Mutex;
+use tokio::sync::{watch, Mutex, Notify};
 use tower_http::cors::{Any, CorsLayer};
 use tower_http::services::ServeDir;
 use which;
 
 use crate::commands;
 
+/// How long to wait for open WebSocket sessions to close after Ctrl+C
+const WS_DRAIN_TIMEOUT: Duration = Duration::from_secs(5);
+
 // Find Claude binary for web mode - use bundled binary first
 fn find_claude_binary_web() -> Result<String, String> {
     // First try the bundled binary (same location as Tauri app uses)
@@ -64,6 +68,10 @@ pub struct AppState {
     // Track active WebSocket sessions for Claude execution
     pub active_sessions:
         Arc<Mutex<std::collections::HashMap<String, tokio::sync::mpsc::Sender<String>>>>,
+    // Flipped to true once the server starts shutting down
+    pub shutdown: watch::Receiver<bool>,
+    // Notified whenever a WebSocket session is removed from active_sessions
+    pub sessions_drained: Arc<Notify>,
 }
 
 #[derive(Debug, Deserialize)]
@@ -278,16 +286,30 @@ async fn claude_websocket_handler(socket: WebSocket, state: AppState) {
 
     // Task to forward channel messages to WebSocket
     let session_id_for_forward = session_id.clone();
+    let mut forward_shutdown = state.shutdown.clone();
     let forward_task = tokio::spawn(async move {
         println!(
             "[TRACE] Forward task started for session {}",
             session_id_for_forward
         );
-        while let Some(message) = rx.recv().await {
-            println!("[TRACE] Forwarding message to WebSocket: {}", message);
-            if sender.send(Message::Text(message.into())).await.is_err() {
-                println!("[TRACE] Failed to send message to WebSocket - connection closed");
-                break;
+        loop {
+            tokio::select! {
+                message = rx.recv() => {
+                    let Some(message) = message else { break };
+                    println!("[TRACE] Forwarding message to WebSocket: {}", message);
+                    if sender.send(Message::Text(message.into())).await.is_err() {
+                        println!("[TRACE] Failed to send message to WebSocket - connection closed");
+                        break;
+                    }
+                }
+                _ = wait_for_shutdown(&mut forward_shutdown) => {
+                    println!(
+                        "[TRACE] Server shutting down - sending close frame for session {}",
+                        session_id_for_forward
+                    );
+                    let _ = sender.send(Message::Close(None)).await;
+                    break;
+                }
             }
         }
         println!(
@@ -298,7 +320,16 @@ async fn claude_websocket_handler(socket: WebSocket, state: AppState) {
 
     // Handle incoming messages from WebSocket
     println!("[TRACE] Starting to listen for WebSocket messages");
-    while let Some(msg) = receiver.next().await {
+    let mut shutdown = state.shutdown.clone();
+    loop {
+        let msg = tokio::select! {
+            msg = receiver.next() => msg,
+            _ = wait_for_shutdown(&mut shutdown) => {
+                println!("[TRACE] Server shutting down - leaving WebSocket message loop");
+                break;
+            }
+        };
+        let Some(msg) = msg else { break };
         println!("[TRACE] Received WebSocket message: {:?}", msg);
         if let Ok(msg) = msg {
             if let Message::Text(text) = msg {
@@ -426,6 +457,14 @@ async fn claude_websocket_handler(socket: WebSocket, state: AppState) {
 
     println!("[TRACE] WebSocket message loop ended");
 
+    let stopping = *state.shutdown.borrow();
+    if stopping {
+        // Let the forward task finish sending its close frame
+        let _ = forward_task.await;
+    } else {
+        forward_task.abort();
+    }
+
     // Clean up session
     {
         let mut sessions = state.active_sessions.lock().await;
@@ -436,8 +475,8 @@ async fn claude_websocket_handler(socket: WebSocket, state: AppState) {
             sessions.len()
         );
     }
+    state.sessions_drained.notify_waiters();
 
-    forward_task.abort();
     println!("[TRACE] WebSocket handler ended for session {}", session_id);
 }
 
@@ -768,9 +807,13 @@ async fn send_to_session(state: &AppState, session_id: &str, message: String) {
 
 /// Create the web server
 pub async fn create_web_server(port: u16) -> Result<(), Box<dyn std::error::Error>> {
+    let (shutdown_tx, shutdown_rx) = watch::channel(false);
     let state = AppState {
         active_sessions: Arc::new(Mutex::new(std::collections::HashMap::new())),
+        shutdown: shutdown_rx,
+        sessions_drained: Arc::new(Notify::new()),
     };
+    let drain_state = state.clone();
 
     // CORS layer to allow requests from phone browsers
     let cors = CorsLayer::new()
@@ -833,11 +876,51 @@ pub async fn create_web_server(port: u16) -> Result<(), Box<dyn std::error::Erro
     println!("📱 Access from phone: http://YOUR_PC_IP:{}", port);
 
     let listener = TcpListener::bind(addr).await?;
-    axum::serve(listener, app).await?;
+    axum::serve(listener, app)
+        .with_graceful_shutdown(shutdown_signal(shutdown_tx))
+        .await?;
+
+    // axum only drains plain HTTP connections; upgraded WebSocket handlers run
+    // in their own tasks, so wait for them to send close frames before the
+    // runtime is dropped
+    if tokio::time::timeout(WS_DRAIN_TIMEOUT, wait_for_sessions_drained(&drain_state))
+        .await
+        .is_err()
+    {
+        println!("⚠️ Timed out waiting for WebSocket sessions to close");
+    }
 
     Ok(())
 }
 
+/// Resolve on Ctrl+C, which stops new connections from being accepted and
+/// tells open WebSocket handlers to close their sockets
+async fn shutdown_signal(shutdown_tx: watch::Sender<bool>) {
+    if let Err(e) = tokio::signal::ctrl_c().await {
+        // Keep serving rather than shutting down straight away
+        eprintln!("❌ Failed to listen for shutdown signal: {}", e);
+        std::future::pending::<()>().await;
+    }
+    println!("🛑 Shutdown signal received, stopping web server...");
+    let _ = shutdown_tx.send(true);
+}
+
+/// Resolve once the server has started shutting down
+async fn wait_for_shutdown(shutdown: &mut watch::Receiver<bool>) {
+    let _ = shutdown.wait_for(|stopping| *stopping).await;
+}
+
+/// Resolve once every WebSocket session has been removed from active_sessions
+async fn wait_for_sessions_drained(state: &AppState) {
+    loop {
+        let drained = state.sessions_drained.notified();
+        if state.active_sessions.lock().await.is_empty() {
+            return;
+        }
+        drained.await;
+    }
+}
+
 /// Start web server mode (alternative to Tauri GUI)
 pub async fn start_web_mode(port: Option<u16>) -> Result<(), Box<dyn std::error::Error>> {
     let port = port.unwrap_or(8080);
@@ -306,10 +306,12 @@ async function handleStreamingCommand<T>(command: string, params?: any): Promise
         session_id: params?.sessionId,
       };
       
+      // Serialize once and reuse the payload for both tracing and sending
+      const payload = JSON.stringify(request);
       console.log(`[TRACE] Sending WebSocket request:`, request);
-      console.log(`[TRACE] Request JSON:`, JSON.stringify(request));
+      console.log(`[TRACE] Request JSON:`, payload);
       
-      ws.send(JSON.stringify(request));
+      ws.send(payload);
       console.log(`[TRACE] WebSocket request sent`);
     };
     